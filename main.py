@@ -4,17 +4,20 @@ Voice-to-Diary Obsidian Note Generator
 Main application entry point
 """
 
+import asyncio
+import contextlib
 import typer
 from rich.console import Console
 from rich.prompt import Prompt
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from pathlib import Path
-import yaml
 from dotenv import load_dotenv
 import time
 from datetime import datetime
 import requests
 import sys
+import functools
+from typing import Annotated, List, Optional
 
 # Import our modules
 from tts_to_obsidian.audio.recorder import AudioRecorder
@@ -35,21 +38,30 @@ console = Console()
 # Load environment variables
 load_dotenv()
 
+# Shared HTTP session so Ollama requests reuse one keep-alive connection
+_SESSION = requests.Session()
+
+@functools.lru_cache(maxsize=1)
+def _ollama_tags() -> dict:
+    """Fetch the Ollama model listing once per process"""
+    response = _SESSION.get("http://localhost:11434/api/tags", timeout=2)
+    response.raise_for_status()
+    return response.json()
+
 def check_ollama_server() -> bool:
     """Check if Ollama server is running and accessible"""
     try:
-        response = requests.get("http://localhost:11434/api/tags")
-        return response.status_code == 200
-    except requests.exceptions.ConnectionError:
+        _ollama_tags()
+        return True
+    except (requests.exceptions.RequestException, ValueError):
         return False
 
 def check_whisper_model() -> bool:
     """Check if any Whisper model is available"""
     try:
-        response = requests.get("http://localhost:11434/api/tags")
-        models = response.json().get("models", [])
+        models = _ollama_tags().get("models", [])
         return any(model["name"].startswith("whisper") for model in models)
-    except (requests.exceptions.ConnectionError, KeyError):
+    except (requests.exceptions.RequestException, ValueError, KeyError):
         return False
 
 def ensure_ollama_ready():
@@ -59,29 +71,130 @@ def ensure_ollama_ready():
         console.print("Please start Ollama by running: ollama serve")
         sys.exit(1)
     
-    if not ensure_ollama_ready():
+    if not check_whisper_model():
         console.print("[yellow]Whisper model not found. Pulling model...[/yellow]")
         try:
             import subprocess
             subprocess.run(["ollama", "pull", "whisper"], check=True)
+            _ollama_tags.cache_clear()
             console.print("[green]Whisper model pulled successfully![/green]")
         except subprocess.CalledProcessError:
             console.print("[red]Error: Failed to pull Whisper model![/red]")
             console.print("Please run: ollama pull whisper")
             sys.exit(1)
 
-def load_config() -> dict:
-    """Load configuration from config.yaml"""
-    config_path = Path("config.yaml")
-    if not config_path.exists():
-        console.print("[red]Error: config.yaml not found![/red]")
-        console.print("Please create a config.yaml file based on config.yaml.example")
-        raise typer.Exit(1)
+@functools.lru_cache(maxsize=4)
+def _get_transcriber(
+    model: str,
+    language: str,
+    temperature: float,
+    initial_prompt: str,
+    device: Optional[str],
+    compile: bool,
+    backend: str,
+    cuda_graphs: bool,
+    quantize: Optional[str],
+    workers: int,
+) -> WhisperTranscriber:
+    """Create a Whisper transcriber, reusing one loaded with the same settings"""
+    return WhisperTranscriber(
+        model=model,
+        language=language,
+        temperature=temperature,
+        initial_prompt=initial_prompt,
+        device=device,
+        compile=compile,
+        backend=backend,
+        cuda_graphs=cuda_graphs,
+        quantize=quantize,
+        workers=workers,
+    )
+
+@functools.lru_cache(maxsize=1)
+def get_enhancer() -> TextEnhancer:
+    """Get the shared text enhancer, loading spaCy on first use"""
+    return TextEnhancer()
+
+@functools.lru_cache(maxsize=4)
+def _get_note_generator(
+    vault_path: str,
+    diary_folder: str,
+    template_path: Optional[str],
+) -> ObsidianNoteGenerator:
+    """Create a note generator, reusing one already set up for the same vault"""
+    return ObsidianNoteGenerator(
+        vault_path=vault_path,
+        diary_folder=diary_folder,
+        template_path=template_path,
+    )
+
+def create_transcriber(config: dict) -> WhisperTranscriber:
+    """Get a Whisper transcriber for the transcription config"""
+    return _get_transcriber(
+        model=config["transcription"]["model"],
+        language=config["transcription"]["language"],
+        temperature=config["transcription"]["temperature"],
+        initial_prompt=config["transcription"]["initial_prompt"],
+        device=config["transcription"].get("device"),
+        compile=config["transcription"].get("compile", False),
+        backend=config["transcription"].get("backend", "faster-whisper"),
+        cuda_graphs=config["transcription"].get("cuda_graphs", False),
+        quantize=config["transcription"].get("quantize"),
+        workers=config["transcription"].get("workers", 1),
+    )
+
+def create_note_generator(config: dict) -> ObsidianNoteGenerator:
+    """Get an Obsidian note generator for the obsidian config"""
+    return _get_note_generator(
+        vault_path=config["obsidian"]["vault_path"],
+        diary_folder=config["obsidian"]["diary_folder"],
+        template_path=config["obsidian"]["template_path"],
+    )
+
+def write_entry(
+    transcription: dict,
+    enhanced: dict,
+    audio_path: Path,
+    config: dict,
+    note_generator: ObsidianNoteGenerator,
+) -> Path:
+    """
+    Write an enhanced transcription to the vault as a diary entry
+    
+    The entry is dated by the recording's modification time. When audio is
+    deleted after processing, the file is only removed once its note has been
+    written.
     
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    Args:
+        transcription: Transcription dictionary returned by WhisperTranscriber
+        enhanced: Enhancement dictionary returned by TextEnhancer
+        audio_path: Path to the transcribed audio file
+        config: Configuration dictionary
+        note_generator: Note generator to use
+        
+    Returns:
+        Path to created Obsidian note
+    """
+    delete_audio = config["privacy"]["delete_audio_after_processing"]
+    note_path = note_generator.create_note(
+        enhanced_transcription={
+            "text": transcription["text"],
+            "duration": transcription["duration"],
+            "mood": enhanced.get("mood", "Neutral"),
+            "topics": enhanced.get("topics", []),
+            "word_count": len(transcription["text"].split()),
+        },
+        recording_path=None if delete_audio else audio_path,
+        recorded_at=datetime.fromtimestamp(audio_path.stat().st_mtime),
+    )
+    
+    # Clean up audio if configured, now that create_note has written the entry
+    if delete_audio:
+        audio_path.unlink()
+    
+    return note_path
 
-def process_audio(
+async def process_audio(
     audio_path: Path,
     config: dict,
     show_progress: bool = True
@@ -89,6 +202,9 @@ def process_audio(
     """
     Process audio file through the entire pipeline
     
+    Blocking stages run in worker threads, so model loading for the
+    transcriber and the text enhancer overlaps.
+    
     Args:
         audio_path: Path to audio file
         config: Configuration dictionary
@@ -104,25 +220,17 @@ def process_audio(
         disable=not show_progress
     ) as progress:
         # Initialize components
-        transcriber = WhisperTranscriber(
-            model=config["transcription"]["model"],
-            language=config["transcription"]["language"],
-            temperature=config["transcription"]["temperature"],
-            initial_prompt=config["transcription"]["initial_prompt"],
-        )
-        
-        enhancer = TextEnhancer()
-        
-        note_generator = ObsidianNoteGenerator(
-            vault_path=config["obsidian"]["vault_path"],
-            diary_folder=config["obsidian"]["diary_folder"],
-            template_path=config["obsidian"]["template_path"],
+        progress.add_task("Loading models...", total=None)
+        transcriber, enhancer = await asyncio.gather(
+            asyncio.to_thread(create_transcriber, config),
+            asyncio.to_thread(get_enhancer),
         )
+        note_generator = create_note_generator(config)
         
         # Transcribe audio
         progress.add_task("Transcribing audio...", total=None)
         try:
-            transcription = transcriber.transcribe(audio_path)
+            transcription = await asyncio.to_thread(transcriber.transcribe, audio_path)
             console.print(f"[green]Transcription successful![/green]")
             console.print(f"[yellow]Transcribed text: {transcription['text'][:100]}...[/yellow]")
         except Exception as e:
@@ -132,27 +240,109 @@ def process_audio(
         
         # Enhance text
         progress.add_task("Enhancing text...", total=None)
-        enhanced = enhancer.enhance(transcription["text"])
+        enhanced = await asyncio.to_thread(enhancer.enhance, transcription["text"])
         console.print(f"[green]Text enhancement complete![/green]")
         
         # Create Obsidian note
         progress.add_task("Creating Obsidian note...", total=None)
-        note_path = note_generator.create_note(
-            enhanced_transcription={
-                "text": transcription["text"],
-                "duration": transcription["duration"],
-                "mood": enhanced.get("mood", "Neutral"),
-                "topics": enhanced.get("topics", []),
-                "word_count": len(transcription["text"].split()),
-            },
-            recording_path=audio_path if not config["privacy"]["delete_audio_after_processing"] else None
+        return await asyncio.to_thread(
+            write_entry, transcription, enhanced, audio_path, config, note_generator
         )
+
+async def process_directory(
+    directory: Path,
+    config: dict,
+    show_progress: bool = True
+) -> List[Path]:
+    """
+    Process every WAV file in a directory with batched transcription
+    
+    Pending files are grouped into batches of up to transcription.batch_size
+    (default 8). Transcription and note writing run as a producer/consumer
+    pair, so the next batch is transcribed while the previous one is
+    enhanced and written; a small queue between them applies backpressure.
+    
+    Args:
+        directory: Directory containing audio files
+        config: Configuration dictionary
+        show_progress: Whether to show progress indicators
+        
+    Returns:
+        Paths to created Obsidian notes
+    """
+    audio_paths = sorted(directory.glob("*.wav"))
+    batch_size = config["transcription"].get("batch_size", 8)
+    note_paths = []
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        disable=not show_progress
+    ) as progress:
+        # Initialize components
+        progress.add_task("Loading models...", total=None)
+        transcriber, enhancer = await asyncio.gather(
+            asyncio.to_thread(create_transcriber, config),
+            asyncio.to_thread(get_enhancer),
+        )
+        note_generator = create_note_generator(config)
+        
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
         
-        # Clean up audio if configured
-        if config["privacy"]["delete_audio_after_processing"]:
-            audio_path.unlink()
+        async def transcribe_batches():
+            try:
+                for start in range(0, len(audio_paths), batch_size):
+                    batch = audio_paths[start:start + batch_size]
+                    progress.add_task(f"Transcribing {len(batch)} files...", total=None)
+                    try:
+                        transcriptions = await asyncio.to_thread(
+                            transcriber.transcribe_batch, batch, batch_size=batch_size
+                        )
+                    except Exception as e:
+                        console.print(
+                            f"[red]Error during transcription: {str(e)}[/red]"
+                        )
+                        console.print(
+                            "[yellow]Please ensure Whisper model is properly "
+                            "installed.[/yellow]"
+                        )
+                        raise typer.Exit(1) from e
+                    await queue.put((batch, transcriptions))
+            except BaseException:
+                # The writer may have stopped draining the queue, so never block here
+                with contextlib.suppress(asyncio.QueueFull):
+                    queue.put_nowait(None)
+                raise
+            await queue.put(None)
         
-        return note_path
+        async def write_batches(producer: asyncio.Task):
+            try:
+                while (item := await queue.get()) is not None:
+                    batch, transcriptions = item
+                    progress.add_task("Creating Obsidian notes...", total=None)
+                    enhanced_batch = await asyncio.to_thread(
+                        enhancer.enhance_batch, [t["text"] for t in transcriptions]
+                    )
+                    for audio_path, transcription, enhanced in zip(
+                        batch, transcriptions, enhanced_batch
+                    ):
+                        note_paths.append(await asyncio.to_thread(
+                            write_entry,
+                            transcription,
+                            enhanced,
+                            audio_path,
+                            config,
+                            note_generator,
+                        ))
+            finally:
+                # Don't leave the transcriber blocked on a queue nobody drains
+                producer.cancel()
+        
+        producer = asyncio.create_task(transcribe_batches())
+        await asyncio.gather(producer, write_batches(producer))
+    
+    return note_paths
 
 @app.command()
 def record():
@@ -168,20 +358,29 @@ def record():
         max_duration=config["audio"]["max_duration"],
     )
     
-    console.print("[green]Starting recording... Press Ctrl+C to stop[/green]")
+    max_length = format_duration(recorder.max_duration)
+    console.print(
+        f"[green]Starting recording (up to {max_length})... "
+        "Press Ctrl+C to stop[/green]"
+    )
     
     try:
         recorder.start_recording()
         while recorder.is_recording():
             time.sleep(0.1)
+        console.print(
+            f"\n[yellow]Reached the maximum recording length of {max_length}, "
+            "stopping recording...[/yellow]"
+        )
     except KeyboardInterrupt:
         console.print("\n[yellow]Stopping recording...[/yellow]")
-        audio_path = recorder.stop_recording()
-        console.print(f"[green]Recording saved to: {audio_path}[/green]")
-        
-        # Process the recording
-        note_path = process_audio(audio_path, config)
-        console.print(f"[green]Diary entry created: {note_path}[/green]")
+    
+    audio_path = recorder.stop_recording()
+    console.print(f"[green]Recording saved to: {audio_path}[/green]")
+    
+    # Process the recording
+    note_path = asyncio.run(process_audio(audio_path, config))
+    console.print(f"[green]Diary entry created: {note_path}[/green]")
 
 @app.command()
 def transcribe(file_path: Path):
@@ -195,12 +394,7 @@ def transcribe(file_path: Path):
     config = load_config()
     
     # Initialize transcriber
-    transcriber = WhisperTranscriber(
-        model=config["transcription"]["model"],
-        language=config["transcription"]["language"],
-        temperature=config["transcription"]["temperature"],
-        initial_prompt=config["transcription"]["initial_prompt"],
-    )
+    transcriber = create_transcriber(config)
     
     # Transcribe file
     with Progress(
@@ -222,7 +416,7 @@ def transcribe(file_path: Path):
 
 @app.command()
 def process(file_path: Path):
-    """Process an audio file and create an Obsidian note"""
+    """Process an audio file, or a directory of WAV files, into Obsidian notes"""
     ensure_ollama_ready()
     
     if not file_path.exists():
@@ -230,9 +424,67 @@ def process(file_path: Path):
         raise typer.Exit(1)
     
     config = load_config()
-    note_path = process_audio(file_path, config)
+    
+    if file_path.is_dir():
+        note_paths = asyncio.run(process_directory(file_path, config))
+        if not note_paths:
+            console.print(f"[yellow]No WAV files found in {file_path}.[/yellow]")
+        for note_path in note_paths:
+            console.print(f"[green]Diary entry created: {note_path}[/green]")
+        return
+    
+    note_path = asyncio.run(process_audio(file_path, config))
     console.print(f"[green]Diary entry created: {note_path}[/green]")
 
+@app.command()
+def serve(
+    watch_dir: Annotated[
+        Path, typer.Argument(help="Directory to watch for new WAV files")
+    ] = Path("recordings"),
+    interval: Annotated[
+        float, typer.Option(help="Seconds between directory scans")
+    ] = 5.0,
+):
+    """Stay resident and turn new WAV files in a directory into Obsidian notes"""
+    config = load_config()
+    ensure_directory(watch_dir)
+    
+    # Load models once up front; every note after this reuses them
+    create_transcriber(config)
+    get_enhancer()
+    
+    # Only files that appear after startup are processed
+    seen = set(watch_dir.glob("*.wav"))
+    console.print(
+        f"[green]Watching {watch_dir} for new recordings... "
+        "Press Ctrl+C to stop[/green]"
+    )
+    
+    try:
+        while True:
+            time.sleep(interval)
+            now = time.time()
+            for audio_path in sorted(set(watch_dir.glob("*.wav")) - seen):
+                # Give writers a full interval to finish the file; it may also
+                # have been removed since the scan, e.g. by another process run
+                try:
+                    if now - audio_path.stat().st_mtime < interval:
+                        continue
+                except FileNotFoundError:
+                    continue
+                seen.add(audio_path)
+                try:
+                    note_path = asyncio.run(
+                        process_audio(audio_path, config, show_progress=False)
+                    )
+                    console.print(f"[green]Diary entry created: {note_path}[/green]")
+                except Exception as e:
+                    console.print(
+                        f"[red]Failed to process {audio_path}: {str(e)}[/red]"
+                    )
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped watching.[/yellow]")
+
 @app.command()
 def cleanup():
     """Clean up old audio files"""
@@ -7,9 +7,6 @@ source .venv/bin/activate
 # Install dependencies
 pip install -r requirements.txt
 
-# Install spaCy model
-python -m spacy download en_core_web_sm
-
 # Create necessary directories
 mkdir -p recordings
 mkdir -p templates
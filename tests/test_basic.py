@@ -4,11 +4,11 @@ Basic tests for Voice-to-Diary application
 
 import pytest
 from pathlib import Path
-from src.tts_to_obsidian.audio.recorder import AudioRecorder
-from src.tts_to_obsidian.transcription.whisper import WhisperTranscriber
-from src.tts_to_obsidian.enhancement.processor import TextEnhancer
-from src.tts_to_obsidian.obsidian.note_generator import ObsidianNoteGenerator
-from src.tts_to_obsidian.utils.helpers import load_config, ensure_directory
+from tts_to_obsidian.audio.recorder import AudioRecorder
+from tts_to_obsidian.transcription.whisper import AudioRing, WhisperTranscriber
+from tts_to_obsidian.enhancement.processor import TextEnhancer
+from tts_to_obsidian.obsidian.note_generator import ObsidianNoteGenerator
+from tts_to_obsidian.utils.helpers import load_config, ensure_directory
 
 @pytest.fixture
 def config():
@@ -28,6 +28,47 @@ def test_audio_recorder(temp_dir):
     assert recorder.chunk_size == 1024
     assert not recorder.is_recording()
 
+def test_audio_callback_stops_at_max_duration(temp_dir, monkeypatch):
+    """Test the callback stops once the buffer is full and saves interleaved frames"""
+    import wave
+
+    import numpy as np
+
+    from tts_to_obsidian.audio import recorder as recorder_module
+
+    monkeypatch.chdir(temp_dir)
+    recorder = AudioRecorder(sample_rate=4, channels=2, max_duration=1)
+    # Drive the callback directly instead of opening an input stream
+    recorder.recording = True
+    block = np.array([[1.0, 0.0], [1.0, 0.0], [1.0, 0.0]], dtype=np.float32)
+
+    recorder._audio_callback(block, 3, None, None)
+    assert recorder.is_recording()
+
+    with pytest.raises(recorder_module.sd.CallbackStop):
+        recorder._audio_callback(-block, 3, None, None)
+    assert recorder.max_duration_reached
+    assert not recorder.is_recording()
+
+    output_path = recorder.stop_recording()
+    with wave.open(str(output_path), "rb") as wf:
+        assert wf.getnchannels() == 2
+        assert wf.getnframes() == 4
+        pcm = np.frombuffer(wf.readframes(4), dtype=np.int16)
+    assert pcm.tolist() == [32767, 0] * 3 + [-32767, 0]
+
+def test_pcm_conversion_clips_out_of_range_samples():
+    """Test float samples outside [-1, 1] clip to the int16 range instead of wrapping"""
+    import numpy as np
+
+    from tts_to_obsidian.utils._fastmath import pcm_f32_to_i16
+
+    src = np.array([1.5, -1.5, -2.0, 1.0, -1.0, 0.0], dtype=np.float32)
+    dst = np.empty(len(src), dtype=np.int16)
+    pcm_f32_to_i16(src, dst)
+
+    assert dst.tolist() == [32767, -32768, -32768, 32767, -32767, 0]
+
 def test_whisper_transcriber():
     """Test Whisper transcriber initialization"""
     transcriber = WhisperTranscriber()
@@ -35,6 +76,100 @@ def test_whisper_transcriber():
     assert transcriber.language == "en"
     assert transcriber.temperature == 0.0
 
+def test_audio_ring_wraps_and_detects_overrun():
+    """Test ring buffer reads across the wrap point and rejects overwritten data"""
+    import numpy as np
+    
+    ring = AudioRing(10)
+    first = ring.write(np.arange(6, dtype=np.int16))
+    assert ring.read(first, 6).tolist() == [0, 1, 2, 3, 4, 5]
+    
+    second = ring.write(np.arange(6, 12, dtype=np.int16))
+    assert ring.read(second, 6).tolist() == [6, 7, 8, 9, 10, 11]
+    
+    with pytest.raises(RuntimeError):
+        ring.read(first, 6)
+
+def _write_wav(path, frames, rate=16000):
+    """Write int16 frames (samples x channels) as a PCM WAV file"""
+    import wave
+
+    import numpy as np
+
+    frames = np.asarray(frames, dtype=np.int16).reshape(len(frames), -1)
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(frames.shape[1])
+        wf.setsampwidth(2)
+        wf.setframerate(rate)
+        wf.writeframes(frames.tobytes())
+
+@pytest.mark.parametrize("use_soundfile", [True, False])
+def test_load_audio_mono(temp_dir, monkeypatch, use_soundfile):
+    """Test mono WAVs load as float32 samples with their duration"""
+    import numpy as np
+
+    from tts_to_obsidian.transcription import whisper as whisper_module
+
+    if use_soundfile and whisper_module.sf is None:
+        pytest.skip("libsndfile is not available")
+    if not use_soundfile:
+        monkeypatch.setattr(whisper_module, "sf", None)
+
+    audio_path = temp_dir / "mono.wav"
+    _write_wav(audio_path, [0, 16384, -16384, -32768] * 4000)
+    transcriber = WhisperTranscriber.__new__(WhisperTranscriber)
+    audio, duration = transcriber._load_audio(audio_path)
+
+    assert audio.dtype == np.float32
+    assert audio.shape == (16000,)
+    assert duration == 1.0
+    assert audio[:4].tolist() == [0.0, 0.5, -0.5, -1.0]
+
+@pytest.mark.parametrize("use_soundfile", [True, False])
+def test_load_audio_downmixes_stereo(temp_dir, monkeypatch, use_soundfile):
+    """Test stereo WAVs are averaged to mono, including across read blocks"""
+    import numpy as np
+
+    from tts_to_obsidian.transcription import whisper as whisper_module
+
+    if use_soundfile and whisper_module.sf is None:
+        pytest.skip("libsndfile is not available")
+    if not use_soundfile:
+        monkeypatch.setattr(whisper_module, "sf", None)
+
+    # Longer than one 65536-frame block read by the soundfile path
+    n = 80000
+    left = np.full(n, 16384, dtype=np.int16)
+    right = np.zeros(n, dtype=np.int16)
+    right[n // 2:] = -16384
+    audio_path = temp_dir / "stereo.wav"
+    _write_wav(audio_path, np.stack([left, right], axis=1))
+    transcriber = WhisperTranscriber.__new__(WhisperTranscriber)
+    audio, duration = transcriber._load_audio(audio_path)
+
+    assert audio.dtype == np.float32
+    assert audio.shape == (n,)
+    assert duration == n / 16000
+    assert np.all(audio[:n // 2] == 0.25)
+    assert np.all(audio[n // 2:] == 0.0)
+
+@pytest.mark.parametrize("use_soundfile", [True, False])
+def test_load_audio_rejects_other_sample_rates(temp_dir, monkeypatch, use_soundfile):
+    """Test audio that isn't sampled at 16 kHz is rejected"""
+    from tts_to_obsidian.transcription import whisper as whisper_module
+
+    if use_soundfile and whisper_module.sf is None:
+        pytest.skip("libsndfile is not available")
+    if not use_soundfile:
+        monkeypatch.setattr(whisper_module, "sf", None)
+
+    audio_path = temp_dir / "8k.wav"
+    _write_wav(audio_path, [0] * 8000, rate=8000)
+    transcriber = WhisperTranscriber.__new__(WhisperTranscriber)
+
+    with pytest.raises(ValueError, match="16000 Hz"):
+        transcriber._load_audio(audio_path)
+
 def test_text_enhancer():
     """Test text enhancer initialization and basic functionality"""
     enhancer = TextEnhancer()
@@ -48,6 +183,38 @@ def test_text_enhancer():
     emotions = enhancer._detect_emotion("I am happy today")
     assert emotions["positive"] > 0
 
+def test_emotion_keywords_match_whole_words():
+    """Test emotion keywords only count as whole words, wherever they appear"""
+    enhancer = TextEnhancer()
+    
+    assert enhancer._detect_emotion("new gloves")["positive"] == 0.0
+    assert enhancer._detect_emotion("lovely day")["positive"] == 0.0
+    
+    emotions = enhancer._detect_emotion("Happy, then sad")
+    assert emotions["positive"] == 1 / 3
+    assert emotions["negative"] == 1 / 3
+    assert enhancer._detect_emotion("so much love")["positive"] == 1 / 3
+
+def test_topics_skip_stop_words_and_dedupe():
+    """Test noun chunks with stop words are dropped and duplicates merged"""
+    from spacy.tokens import Doc
+    
+    enhancer = TextEnhancer()
+    doc = Doc(
+        enhancer.nlp.vocab,
+        words=["Coffee", "helps", ".", "coffee", "helps", ".",
+               "The", "garden", "grows", "."],
+        pos=["NOUN", "VERB", "PUNCT", "NOUN", "VERB", "PUNCT",
+             "DET", "NOUN", "VERB", "PUNCT"],
+        heads=[1, 1, 1, 4, 4, 4, 7, 8, 8, 8],
+        deps=["nsubj", "ROOT", "punct", "nsubj", "ROOT", "punct",
+              "det", "nsubj", "ROOT", "punct"],
+    )
+    
+    chunks = [chunk.text for chunk in doc.noun_chunks]
+    assert chunks == ["Coffee", "coffee", "The garden"]
+    assert enhancer._identify_topics(doc) == ["Coffee"]
+
 def test_obsidian_note_generator(temp_dir):
     """Test Obsidian note generator"""
     generator = ObsidianNoteGenerator(
@@ -76,6 +243,121 @@ def test_obsidian_note_generator(temp_dir):
     assert "Test diary entry" in content
     assert "#test" in content
 
+def test_related_entries_across_month_boundary(temp_dir):
+    """Test related entries are found in the previous month"""
+    from datetime import datetime
+    
+    generator = ObsidianNoteGenerator(
+        vault_path=str(temp_dir),
+        diary_folder="test_diary"
+    )
+    (generator.diary_path / "2024-02-28.md").write_text("Earlier entry")
+    
+    related = generator._get_related_entries(datetime(2024, 3, 2))
+    assert related == "- [[2024-02-28]]"
+
+def test_notes_on_same_day_are_kept(temp_dir):
+    """Test each recording of a day gets its own note"""
+    from datetime import datetime
+    
+    generator = ObsidianNoteGenerator(
+        vault_path=str(temp_dir),
+        diary_folder="test_diary"
+    )
+    recorded_at = datetime(2024, 3, 2, 9, 30)
+    first = generator.create_note({"text": "Morning entry"}, recorded_at=recorded_at)
+    second = generator.create_note({"text": "Evening entry"}, recorded_at=recorded_at)
+    
+    assert first.name == "2024-03-02.md"
+    assert second.name == "2024-03-02 (2).md"
+    assert "Morning entry" in first.read_text()
+    assert "Evening entry" in second.read_text()
+    
+    related = generator._get_related_entries(datetime(2024, 3, 3))
+    assert related == "- [[2024-03-02]]\n- [[2024-03-02 (2)]]"
+
+def test_template_matches_str_format(temp_dir):
+    """Test custom templates render exactly like str.format, including escapes"""
+    from datetime import datetime
+    
+    template = "{{date}} {date} {word_count:>3} {mood!r}\n{content}"
+    template_path = temp_dir / "template.md"
+    template_path.write_text(template)
+    
+    generator = ObsidianNoteGenerator(
+        vault_path=str(temp_dir),
+        diary_folder="test_diary",
+        template_path=str(template_path)
+    )
+    note_path = generator.create_note(
+        {"text": "Entry", "mood": "Happy", "word_count": 1},
+        recorded_at=datetime(2024, 3, 2, 9, 30)
+    )
+    
+    assert note_path.read_text() == "{date} 2024-03-02   1 'Happy'\nEntry"
+
+def test_audio_names_do_not_collide_across_generators(temp_dir):
+    """Test generators sharing a vault never overwrite each other's audio"""
+    recording = temp_dir / "recording.wav"
+    recording.write_bytes(b"first")
+    other = temp_dir / "other.wav"
+    other.write_bytes(b"second")
+    
+    first = ObsidianNoteGenerator(vault_path=str(temp_dir / "vault"))
+    second = ObsidianNoteGenerator(vault_path=str(temp_dir / "vault"))
+    first_link = first._copy_audio_file(recording)
+    second_link = second._copy_audio_file(other)
+    
+    assert first_link != second_link
+    audio = sorted(p.read_bytes() for p in first.audio_path.iterdir())
+    assert audio == [b"first", b"second"]
+
+def test_process_directory_stops_when_writing_fails(temp_dir, monkeypatch):
+    """Test a failing note write doesn't leave transcription blocked on the queue"""
+    import asyncio
+    import threading
+    import time
+
+    import main
+
+    for i in range(6):
+        (temp_dir / f"{i}.wav").touch()
+
+    class Transcriber:
+        def transcribe_batch(self, batch, batch_size):
+            return [{"text": "hello"} for _ in batch]
+
+    class Enhancer:
+        def enhance_batch(self, texts):
+            # Give the transcription stage time to fill the queue
+            time.sleep(0.2)
+            return [{} for _ in texts]
+
+    def write_entry(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(main, "create_transcriber", lambda config: Transcriber())
+    monkeypatch.setattr(main, "get_enhancer", Enhancer)
+    monkeypatch.setattr(main, "create_note_generator", lambda config: None)
+    monkeypatch.setattr(main, "write_entry", write_entry)
+    config = {"transcription": {"batch_size": 1}}
+    errors = []
+
+    def run():
+        try:
+            asyncio.run(
+                main.process_directory(temp_dir, config, show_progress=False)
+            )
+        except OSError as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert [str(e) for e in errors] == ["disk full"]
+
 def test_helpers(temp_dir):
     """Test helper functions"""
     # Test directory creation
@@ -85,7 +367,103 @@ def test_helpers(temp_dir):
     assert test_dir.is_dir()
     
     # Test duration formatting
-    from src.tts_to_obsidian.utils.helpers import format_duration
+    from tts_to_obsidian.utils.helpers import format_duration
     assert format_duration(65) == "1m 5s"
     assert format_duration(3665) == "1h 1m 5s"
-    assert format_duration(45) == "45s" 
\ No newline at end of file
+    assert format_duration(45) == "45s" 
+
+def test_load_config_reloads_on_change(temp_dir):
+    """Test config is cached per path, refreshed on change and copied per caller"""
+    import os
+
+    from tts_to_obsidian.utils.helpers import _CFG_CACHE
+    
+    config_path = temp_dir / "config.yaml"
+    config_path.write_text("audio:\n  sample_rate: 16000\n")
+    os.utime(config_path, (1000, 1000))
+    
+    config = load_config(config_path)
+    config["audio"]["sample_rate"] = 8000
+    assert load_config(config_path)["audio"]["sample_rate"] == 16000
+    
+    config_path.write_text("audio:\n  sample_rate: 44100\n")
+    os.utime(config_path, (2000, 2000))
+    assert load_config(config_path)["audio"]["sample_rate"] == 44100
+    assert _CFG_CACHE[str(config_path)][0] == 2000
+
+def test_copy_to_obsidian_media(temp_dir, monkeypatch):
+    """Test media sync links, skips up-to-date files, replaces stale ones and copies"""
+    import errno
+    import os
+
+    from tts_to_obsidian.utils import helpers
+    
+    source = temp_dir / "entry.wav"
+    source.write_bytes(b"audio")
+    os.utime(source, (1000, 1000))
+    vault = temp_dir / "vault"
+    vault.mkdir()
+    
+    # Same filesystem: hard-linked
+    dest = helpers.copy_to_obsidian_media(source, vault)
+    assert dest == vault / "media" / "entry.wav"
+    assert dest.stat().st_ino == source.stat().st_ino
+    
+    # Same size and mtime: left alone
+    dest.unlink()
+    dest.write_bytes(b"other")
+    os.utime(dest, (1000, 1000))
+    helpers.copy_to_obsidian_media(source, vault)
+    assert dest.read_bytes() == b"other"
+    
+    # Changed: replaced
+    os.utime(dest, (2000, 2000))
+    helpers.copy_to_obsidian_media(source, vault)
+    assert dest.read_bytes() == b"audio"
+    
+    # Links unsupported: copied with metadata
+    def cross_device_link(src, dst):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+    
+    monkeypatch.setattr(helpers.os, "link", cross_device_link)
+    dest.unlink()
+    helpers.copy_to_obsidian_media(source, vault)
+    assert dest.read_bytes() == b"audio"
+    assert dest.stat().st_ino != source.stat().st_ino
+    assert dest.stat().st_mtime == 1000
+
+def test_cleanup_old_files(temp_dir):
+    """Test cleanup removes only old regular files matching the pattern"""
+    import os
+
+    from tts_to_obsidian.utils.helpers import cleanup_old_files
+    
+    old = [temp_dir / "a.wav", temp_dir / "b.wav", temp_dir / "notes.txt"]
+    for path in old:
+        path.write_bytes(b"x")
+        os.utime(path, (1000, 1000))
+    (temp_dir / "new.wav").write_bytes(b"x")
+    (temp_dir / "dir.wav").mkdir()
+    os.utime(temp_dir / "dir.wav", (1000, 1000))
+    (temp_dir / "link.wav").symlink_to(temp_dir / "notes.txt")
+    
+    # Several matches go through the thread pool
+    cleanup_old_files(temp_dir, "*.wav", days=1)
+    assert sorted(p.name for p in temp_dir.iterdir()) == [
+        "dir.wav", "link.wav", "new.wav", "notes.txt"
+    ]
+    
+    # A single match is removed inline
+    cleanup_old_files(temp_dir, "*.txt", days=1)
+    assert not (temp_dir / "notes.txt").exists()
+
+def test_get_timestamp_format():
+    """Test timestamps keep the datetime.isoformat() shape"""
+    import re
+    from datetime import datetime
+
+    from tts_to_obsidian.utils.helpers import get_timestamp
+    
+    timestamp = get_timestamp()
+    assert re.fullmatch(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{6}", timestamp)
+    assert abs((datetime.fromisoformat(timestamp) - datetime.now()).total_seconds()) < 5
\ No newline at end of file
@@ -7,10 +7,12 @@ import numpy as np
 from pathlib import Path
 import wave
 import threading
-import queue
 from typing import Optional, Callable
 from datetime import datetime
 
+from ..utils._fastmath import pcm_f32_to_i16
+
+
 class AudioRecorder:
     def __init__(
         self,
@@ -24,7 +26,13 @@ class AudioRecorder:
         self.chunk_size = chunk_size
         self.max_duration = max_duration
         self.recording = False
-        self.audio_queue = queue.Queue()
+        # Preallocated capture buffer, filled by the audio callback
+        self._buf = np.empty(
+            (self.max_duration * self.sample_rate, self.channels), dtype=np.float32
+        )
+        self._write = 0
+        # Set by the audio callback once max_duration of audio has been captured
+        self.max_duration_reached = False
         self.recording_thread: Optional[threading.Thread] = None
         self.callback: Optional[Callable] = None
 
@@ -32,7 +40,13 @@ class AudioRecorder:
         """Callback for audio stream"""
         if status:
             print(f"Status: {status}")
-        self.audio_queue.put(indata.copy())
+        n = min(frames, len(self._buf) - self._write)
+        self._buf[self._write:self._write + n] = indata[:n]
+        self._write += n
+        if n < frames:
+            # Buffer full: max_duration reached
+            self.max_duration_reached = True
+            raise sd.CallbackStop
 
     def start_recording(self, callback: Optional[Callable] = None):
         """Start recording audio"""
@@ -41,7 +55,8 @@ class AudioRecorder:
 
         self.recording = True
         self.callback = callback
-        self.audio_queue = queue.Queue()
+        self._write = 0
+        self.max_duration_reached = False
 
         def recording_thread():
             with sd.InputStream(
@@ -70,22 +85,21 @@ class AudioRecorder:
         output_path = Path(f"recordings/{timestamp}.wav")
         output_path.parent.mkdir(exist_ok=True)
 
-        # Convert queue data to numpy array
-        audio_data = []
-        while not self.audio_queue.empty():
-            audio_data.append(self.audio_queue.get())
-        
-        if not audio_data:
+        if self._write == 0:
             raise RuntimeError("No audio data recorded")
 
-        audio_data = np.concatenate(audio_data, axis=0)
+        audio_data = self._buf[:self._write].reshape(-1)
+
+        # Convert to 16-bit PCM (interleaved frames for multi-channel audio)
+        pcm = np.empty(len(audio_data), dtype=np.int16)
+        pcm_f32_to_i16(audio_data, pcm)
 
         # Save as WAV file
         with wave.open(str(output_path), "wb") as wf:
             wf.setnchannels(self.channels)
             wf.setsampwidth(2)  # 16-bit audio
             wf.setframerate(self.sample_rate)
-            wf.writeframes((audio_data * 32767).astype(np.int16).tobytes())
+            wf.writeframes(pcm)
 
         if self.callback:
             self.callback(output_path)
@@ -93,5 +107,5 @@ class AudioRecorder:
         return output_path
 
     def is_recording(self) -> bool:
-        """Check if currently recording"""
-        return self.recording 
\ No newline at end of file
+        """Check if currently recording, i.e. started and not yet at max_duration"""
+        return self.recording and not self.max_duration_reached 
\ No newline at end of file
@@ -5,54 +5,65 @@ Text enhancement module for processing and structuring transcriptions
 import re
 from datetime import datetime
 from typing import Dict, Any, List, Tuple
+import ahocorasick
+import numpy as np
 import spacy
+from spacy.lang.en.stop_words import STOP_WORDS
+from spacy.tokens import Doc
 from dateutil import parser
-import nltk
-from nltk.tokenize import sent_tokenize
-from nltk.corpus import stopwords
 
 class TextEnhancer:
+    # Keyword lexicons for basic emotion detection
+    POSITIVE_WORDS = frozenset(
+        {"happy", "joy", "excited", "great", "wonderful", "love"}
+    )
+    NEGATIVE_WORDS = frozenset(
+        {"sad", "angry", "upset", "terrible", "hate", "awful"}
+    )
+
+    # Precompiled patterns for text cleanup
+    _RE_WS = re.compile(r"\s+")
+    _RE_SPACE_BEFORE_PUNCT = re.compile(r" ([.,!?])")
+    _RE_SENT_START = re.compile(r"(?:^|(?<=[.!?] ))\w")
+
     def __init__(self):
-        # Download required NLTK data
-        try:
-            nltk.data.find("tokenizers/punkt")
-        except LookupError:
-            nltk.download("punkt")
-        try:
-            nltk.data.find("corpora/stopwords")
-        except LookupError:
-            nltk.download("stopwords")
+        # Load spaCy model (installed as a package dependency). Lemmas are never
+        # used; the attribute ruler has to stay because it sets the coarse POS
+        # tags that noun_chunks relies on.
+        self.nlp = spacy.load("en_core_web_sm", disable=["lemmatizer"])
 
-        # Load spaCy model
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Downloading spaCy model...")
-            spacy.cli.download("en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
+        # spaCy's stop word list ships with spaCy itself, so nothing is downloaded
+        self.stop_words = set(STOP_WORDS)
 
-        self.stop_words = set(stopwords.words("english"))
+        # Single automaton over both emotion lexicons: one linear scan per text
+        # regardless of lexicon size. Values are (sign, keyword length).
+        self._emotion_automaton = ahocorasick.Automaton()
+        for word in self.POSITIVE_WORDS:
+            self._emotion_automaton.add_word(word, (1, len(word)))
+        for word in self.NEGATIVE_WORDS:
+            self._emotion_automaton.add_word(word, (-1, len(word)))
+        self._emotion_automaton.make_automaton()
+        # Lowercase-form hashes of the stop words, for vectorized chunk filtering
+        self._stop_hashes = np.sort(np.fromiter(
+            (self.nlp.vocab.strings.add(w) for w in self.stop_words),
+            dtype=np.uint64,
+            count=len(self.stop_words),
+        ))
 
     def _clean_text(self, text: str) -> str:
         """Clean up text by removing filler words and fixing common issues"""
-        # Remove extra whitespace
-        text = re.sub(r"\s+", " ", text).strip()
+        # Remove extra whitespace; after this every gap is a single space
+        text = self._RE_WS.sub(" ", text).strip()
         
         # Fix common punctuation issues
-        text = re.sub(r"\s+([.,!?])", r"\1", text)
-        text = re.sub(r"([.,!?])\s+", r"\1 ", text)
+        text = self._RE_SPACE_BEFORE_PUNCT.sub(r"\1", text)
         
         # Fix capitalization at start of sentences
-        sentences = sent_tokenize(text)
-        sentences = [s[0].upper() + s[1:] for s in sentences]
-        text = " ".join(sentences)
-        
-        return text
+        return self._RE_SENT_START.sub(lambda m: m.group().upper(), text)
 
-    def _detect_dates(self, text: str) -> List[Tuple[str, datetime]]:
-        """Detect and parse dates mentioned in text"""
+    def _detect_dates(self, doc: Doc) -> List[Tuple[str, datetime]]:
+        """Detect and parse dates mentioned in a parsed text"""
         dates = []
-        doc = self.nlp(text)
         
         for ent in doc.ents:
             if ent.label_ == "DATE":
@@ -64,34 +75,50 @@ class TextEnhancer:
         
         return dates
 
-    def _identify_topics(self, text: str) -> List[str]:
-        """Identify main topics from text"""
-        doc = self.nlp(text)
-        topics = []
-        
-        # Extract noun phrases and named entities
-        for chunk in doc.noun_chunks:
-            if not any(word.text.lower() in self.stop_words for word in chunk):
-                topics.append(chunk.text)
+    def _identify_topics(self, doc: Doc) -> List[str]:
+        """Identify main topics from a parsed text"""
+        topics = {}
+        
+        # Extract noun phrases and named entities, deduplicated case-insensitively
+        chunks = list(doc.noun_chunks)
+        if chunks:
+            # One membership test over every chunk token instead of a Python loop
+            lower_hashes = np.fromiter(
+                (token.lower for chunk in chunks for token in chunk),
+                dtype=np.uint64,
+            )
+            is_stop = np.isin(lower_hashes, self._stop_hashes)
+            offsets = np.cumsum([0] + [len(chunk) for chunk in chunks])
+            has_stop = np.logical_or.reduceat(is_stop, offsets[:-1])
+            for chunk, rejected in zip(chunks, has_stop):
+                if not rejected:
+                    topics.setdefault(chunk.text.lower(), chunk.text)
         
         for ent in doc.ents:
             if ent.label_ in ["PERSON", "ORG", "GPE", "EVENT"]:
-                topics.append(ent.text)
+                topics.setdefault(ent.text.lower(), ent.text)
         
-        return list(set(topics))
+        return list(topics.values())
 
     def _detect_emotion(self, text: str) -> Dict[str, float]:
         """Detect emotional tone of text (basic implementation)"""
         # This is a very basic implementation
         # In a real application, you might want to use a more sophisticated
         # emotion detection model or API
-        positive_words = {"happy", "joy", "excited", "great", "wonderful", "love"}
-        negative_words = {"sad", "angry", "upset", "terrible", "hate", "awful"}
-        
-        words = text.lower().split()
-        positive_count = sum(1 for word in words if word in positive_words)
-        negative_count = sum(1 for word in words if word in negative_words)
-        total = len(words)
+        text = text.lower()
+        positive_count = negative_count = 0
+        for end, (sign, length) in self._emotion_automaton.iter(text):
+            start = end - length + 1
+            # Only count whole-word matches ("love" but not "gloves")
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end + 1 < len(text) and text[end + 1].isalnum():
+                continue
+            if sign > 0:
+                positive_count += 1
+            else:
+                negative_count += 1
+        total = len(text.split())
         
         if total == 0:
             return {"positive": 0.0, "negative": 0.0, "neutral": 1.0}
@@ -112,22 +139,53 @@ class TextEnhancer:
         Returns:
             Enhanced transcription with additional metadata
         """
-
-        
-        # Clean up text
         cleaned_text = self._clean_text(transcription)
+        return self._enhance_doc(transcription, cleaned_text, self.nlp(cleaned_text))
+
+    def enhance_batch(
+        self,
+        transcriptions: List[str],
+        batch_size: int = 16,
+        n_process: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """
+        Enhance several transcriptions, streaming them through spaCy together
         
+        Args:
+            transcriptions: Raw transcription texts
+            batch_size: Number of texts spaCy processes per batch
+            n_process: Number of spaCy worker processes
+            
+        Returns:
+            Enhanced transcriptions, in input order
+        """
+        cleaned_texts = [self._clean_text(t) for t in transcriptions]
+        docs = self.nlp.pipe(cleaned_texts, batch_size=batch_size, n_process=n_process)
+        return [
+            self._enhance_doc(transcription, cleaned_text, doc)
+            for transcription, cleaned_text, doc in zip(
+                transcriptions, cleaned_texts, docs
+            )
+        ]
+
+    def _enhance_doc(
+        self,
+        transcription: str,
+        cleaned_text: str,
+        doc: Doc,
+    ) -> Dict[str, Any]:
+        """Build the enhanced transcription from cleaned text and its spaCy doc"""
         # Detect dates
-        dates = self._detect_dates(cleaned_text)
+        dates = self._detect_dates(doc)
         
         # Identify topics
-        topics = self._identify_topics(cleaned_text)
+        topics = self._identify_topics(doc)
         
         # Detect emotion
         emotions = self._detect_emotion(cleaned_text)
         
         # Structure into paragraphs
-        sentences = sent_tokenize(cleaned_text)
+        sentences = [sent.text for sent in doc.sents]
         paragraphs = []
         current_paragraph = []
         
@@ -2,15 +2,47 @@
 Obsidian note generation module
 """
 
+import os
+import errno
+import itertools
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 import yaml
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import shutil
 import re
+import string
 import time
 
 class ObsidianNoteGenerator:
+    # Note template used when no template file is configured
+    DEFAULT_TEMPLATE = """
+# Diary Entry - {date}
+
+## Metadata
+- Time: {time}
+- Duration: {duration}
+- Mood: {mood}
+- Topics: {topics}
+- Word Count: {word_count}
+- Weather: {weather}
+- Location: {location}
+
+## Content
+{content}
+
+## Related Entries
+{related_entries}
+
+## Audio Recording
+{audio_link}
+"""
+
+    # Errors from os.link meaning hard links aren't possible here, so copy instead
+    LINK_UNSUPPORTED_ERRNOS = {
+        errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP
+    }
+
     def __init__(
         self,
         vault_path: str,
@@ -29,13 +61,38 @@ class ObsidianNoteGenerator:
         self.diary_folder = diary_folder
         self.template_path = Path(template_path) if template_path else None
         
+        # Load the template once and pre-parse it into (literal text, field name,
+        # format spec, conversion) tuples, exactly as str.format would
+        if self.template_path and self.template_path.exists():
+            with open(self.template_path) as f:
+                template = f.read()
+        else:
+            template = self.DEFAULT_TEMPLATE
+        self._formatter = string.Formatter()
+        self._template_parts = list(self._formatter.parse(template))
+        
         # Create diary folder if it doesn't exist
         self.diary_path = self.vault_path / diary_folder
         self.diary_path.mkdir(parents=True, exist_ok=True)
         
+        # Cached diary entry names by date, refreshed when the folder's mtime changes
+        self._entries_by_day: Dict[str, List[str]] = {}
+        self._entries_mtime: Optional[float] = None
+        
         # Create audio folder for recordings
         self.audio_path = self.vault_path / "attachments" / "audio"
         self.audio_path.mkdir(parents=True, exist_ok=True)
+        
+        # Audio file sequence: starts at the current epoch in milliseconds, or
+        # past the highest existing number, and only ever increases
+        existing = [
+            int(match.group(1))
+            for p in self.audio_path.iterdir()
+            if (match := re.fullmatch(r"diary_(\d+)", p.stem))
+        ]
+        self._seq = itertools.count(
+            max([int(time.time() * 1000), *(n + 1 for n in existing)])
+        )
 
     def _get_weather(self) -> str:
         """Get current weather (dummy implementation)"""
@@ -45,6 +102,16 @@ class ObsidianNoteGenerator:
         """Get current location (dummy implementation)"""
         return "Home Office"
 
+    def _get_entries_by_day(self) -> Dict[str, List[str]]:
+        """Get existing entry names by date, re-listing only when the folder changed"""
+        mtime = self.diary_path.stat().st_mtime
+        if mtime != self._entries_mtime:
+            self._entries_by_day = {}
+            for name in sorted(p.stem for p in self.diary_path.glob("*.md")):
+                self._entries_by_day.setdefault(name[:10], []).append(name)
+            self._entries_mtime = mtime
+        return self._entries_by_day
+
     def _get_related_entries(self, current_date: datetime) -> str:
         """
         Find related diary entries based on date proximity
@@ -55,20 +122,27 @@ class ObsidianNoteGenerator:
         Returns:
             Markdown formatted list of related entries
         """
-        related_entries = []
+        entries_by_day = self._get_entries_by_day()
         
         # Look for entries within the last 7 days
-        for i in range(1, 8):
-            check_date = current_date.replace(day=current_date.day - i)
-            entry_path = self.diary_path / f"{check_date.strftime('%Y-%m-%d')}.md"
-            if entry_path.exists():
-                related_entries.append(f"- [[{check_date.strftime('%Y-%m-%d')}]]")
+        related_entries = [
+            f"- [[{name}]]"
+            for i in range(1, 8)
+            for name in entries_by_day.get(
+                (current_date - timedelta(days=i)).strftime("%Y-%m-%d"), []
+            )
+        ]
         
         return "\n".join(related_entries) if related_entries else "No recent entries"
 
     def _copy_audio_file(self, recording_path: Path) -> str:
         """
-        Copy audio file to vault attachments and return markdown link
+        Place audio file in vault attachments and return markdown link
+        
+        The file is hard-linked when the vault is on the same filesystem as
+        the recording, so no audio data is copied; otherwise it is copied.
+        Names already taken, e.g. by another generator or process sharing the
+        vault, are skipped rather than overwritten.
         
         Args:
             recording_path: Path to audio recording
@@ -79,21 +153,75 @@ class ObsidianNoteGenerator:
         if not recording_path:
             return "No audio recording"
             
-        # Create filename with epoch timestamp and random suffix
-        epoch = int(time.time() * 1000)  # milliseconds since epoch
-        new_filename = f"diary_{epoch}{recording_path.suffix}"
-        new_path = self.audio_path / new_filename
+        while True:
+            # Create filename from the sequence
+            new_filename = f"diary_{next(self._seq)}{recording_path.suffix}"
+            new_path = self.audio_path / new_filename
+            
+            # Link file into vault, copying where links aren't supported
+            try:
+                os.link(recording_path, new_path)
+            except FileExistsError:
+                continue
+            except OSError as e:
+                if e.errno not in self.LINK_UNSUPPORTED_ERRNOS:
+                    raise
+                try:
+                    with open(recording_path, "rb") as src, open(new_path, "xb") as dst:
+                        shutil.copyfileobj(src, dst)
+                except FileExistsError:
+                    continue
+                shutil.copystat(recording_path, new_path)
+            
+            # Return markdown link
+            return f"![[{new_filename}]]"
+
+    def _format_field(
+        self,
+        values: Dict[str, Any],
+        field: str,
+        spec: str,
+        conversion: Optional[str],
+    ) -> str:
+        """Render one pre-parsed template field the way str.format does"""
+        fmt = self._formatter
+        obj = fmt.convert_field(fmt.get_field(field, (), values)[0], conversion)
+        if "{" in spec:
+            spec = fmt.vformat(spec, (), values)
+        return fmt.format_field(obj, spec)
+
+    def _write_new_note(self, date_str: str, content: str) -> Path:
+        """
+        Write content to a note that doesn't exist yet
         
-        # Copy file to vault
-        shutil.copy2(recording_path, new_path)
+        The first entry of a day is named after the date; later entries get a
+        counter suffix, e.g. "2024-03-02 (2)". Files are created exclusively, so
+        concurrent writers never overwrite each other's entries.
         
-        # Return markdown link
-        return f"![[{new_filename}]]"
+        Args:
+            date_str: Entry date as YYYY-MM-DD
+            content: Note content
+            
+        Returns:
+            Path to created note
+        """
+        for n in itertools.count(1):
+            name = date_str if n == 1 else f"{date_str} ({n})"
+            note_path = self.diary_path / f"{name}.md"
+            try:
+                with open(note_path, "x") as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+            except FileExistsError:
+                continue
+            return note_path
 
     def create_note(
         self,
         enhanced_transcription: Dict[str, Any],
         recording_path: Optional[Path] = None,
+        recorded_at: Optional[datetime] = None,
     ) -> Path:
         """
         Create a new diary entry in Obsidian vault
@@ -101,42 +229,22 @@ class ObsidianNoteGenerator:
         Args:
             enhanced_transcription: Enhanced transcription data
             recording_path: Path to audio recording
+            recorded_at: When the entry was recorded (default: the recording's
+                modification time, or now without a recording)
             
         Returns:
             Path to created note
         """
-        # Get current date and time
-        now = datetime.now()
+        # Date the entry by when it was recorded, not when it was processed
+        if recorded_at is not None:
+            now = recorded_at
+        elif recording_path:
+            now = datetime.fromtimestamp(recording_path.stat().st_mtime)
+        else:
+            now = datetime.now()
         date_str = now.strftime("%Y-%m-%d")
         time_str = now.strftime("%H:%M")
         
-        # Prepare note content
-        if self.template_path and self.template_path.exists():
-            with open(self.template_path) as f:
-                template = f.read()
-        else:
-            template = """
-# Diary Entry - {date}
-
-## Metadata
-- Time: {time}
-- Duration: {duration}
-- Mood: {mood}
-- Topics: {topics}
-- Word Count: {word_count}
-- Weather: {weather}
-- Location: {location}
-
-## Content
-{content}
-
-## Related Entries
-{related_entries}
-
-## Audio Recording
-{audio_link}
-"""
-        
         # Get additional metadata
         weather = self._get_weather()
         location = self._get_location()
@@ -144,23 +252,25 @@ class ObsidianNoteGenerator:
         audio_link = self._copy_audio_file(recording_path) if recording_path else "No audio recording"
         
         # Format note content
-        content = template.format(
-            date=date_str,
-            time=time_str,
-            duration=enhanced_transcription.get("duration", "Unknown"),
-            mood=enhanced_transcription.get("mood", "Neutral"),
-            topics=", ".join(enhanced_transcription.get("topics", [])),
-            word_count=enhanced_transcription.get("word_count", 0),
-            content=enhanced_transcription.get("text", ""),
-            weather=weather,
-            location=location,
-            related_entries=related_entries,
-            audio_link=audio_link
+        values = {
+            "date": date_str,
+            "time": time_str,
+            "duration": enhanced_transcription.get("duration", "Unknown"),
+            "mood": enhanced_transcription.get("mood", "Neutral"),
+            "topics": ", ".join(enhanced_transcription.get("topics", [])),
+            "word_count": enhanced_transcription.get("word_count", 0),
+            "content": enhanced_transcription.get("text", ""),
+            "weather": weather,
+            "location": location,
+            "related_entries": related_entries,
+            "audio_link": audio_link,
+        }
+        content = "".join(
+            literal
+            if field is None
+            else literal + self._format_field(values, field, spec, conversion)
+            for literal, field, spec, conversion in self._template_parts
         )
         
         # Create note file
-        note_path = self.diary_path / f"{date_str}.md"
-        with open(note_path, "w") as f:
-            f.write(content)
-        
-        return note_path 
\ No newline at end of file
+        return self._write_new_note(date_str, content) 
\ No newline at end of file
@@ -1,22 +1,392 @@
 """
-Transcription module using Whisper directly
+Transcription module using Whisper (faster-whisper by default, or openai-whisper)
 """
 
-import whisper
 import numpy as np
 import sounddevice as sd
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Tuple, Union
 import wave
 import time
+import functools
+import contextlib
+import os
+import shutil
+import tempfile
+import weakref
 from queue import Queue
 import threading
 import logging
 
+# torch and openai-whisper are imported where they're used, so the default
+# faster-whisper backend doesn't pay for loading PyTorch
+if TYPE_CHECKING:
+    import torch
+
+# libsndfile is a system library; fall back to the stdlib WAV reader without it
+try:
+    import soundfile as sf
+except (ImportError, OSError):
+    sf = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of dummy forward passes used to trigger compilation before first use
+NUM_WARMUP = 2
+
+# Whisper models take 16 kHz audio in 30-second windows
+SAMPLE_RATE = 16000
+N_SAMPLES = 30 * SAMPLE_RATE
+
+# Where ONNX exports of Hugging Face checkpoints are kept between runs
+ONNX_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "tts_to_obsidian"
+    / "onnx"
+)
+
+
+def _detect_device(backend: str) -> str:
+    """
+    Pick the device to run on when none is configured
+    
+    faster-whisper asks CTranslate2 for a GPU so PyTorch is never imported.
+    MPS is never picked automatically: openai-whisper's sparse alignment_heads
+    buffer can't be moved to it, so it has to be requested explicitly.
+    """
+    if backend == "faster-whisper":
+        import ctranslate2
+
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    return "cpu"
+
+
+def _compile_model(stt, device: str):
+    """
+    Compile the encoder and decoder with TorchInductor and warm them up
+    
+    The encoder always sees fixed-shape (batch, n_mels, 3000) log-mel input,
+    so it compiles to a single full graph. The decoder's hook-based KV cache
+    grows every step, so it is compiled without fullgraph and specializes on
+    dynamic sequence length after the first recompile. Warm-up runs full
+    transcriptions of one second of silence so the first real call doesn't
+    pay the compile time.
+    """
+    import torch
+
+    if not hasattr(torch, "compile"):
+        logger.warning(
+            "torch.compile requires PyTorch 2.0 or newer; skipping compilation"
+        )
+        return
+
+    import torch._inductor.config as inductor_config
+
+    inductor_config.fx_graph_cache = True
+    inductor_config.coordinate_descent_tuning = True
+
+    logger.info("Compiling Whisper encoder and decoder...")
+    stt.encoder = torch.compile(stt.encoder, mode="reduce-overhead", fullgraph=True)
+    stt.decoder = torch.compile(stt.decoder, mode="reduce-overhead")
+
+    silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    for _ in range(NUM_WARMUP):
+        stt.transcribe(silence, fp16=device != "cpu", temperature=0.0)
+    logger.info("Model compilation complete")
+
+
+@functools.lru_cache(maxsize=1)
+def _cuda_graph_encoder_class():
+    """Define the CUDA graph encoder wrapper once torch has been imported"""
+    import torch
+
+    class _CUDAGraphEncoder(torch.nn.Module):
+        """
+        Audio encoder that replays a captured CUDA graph
+        
+        One graph is captured per input shape (i.e. per batch size) against static
+        input and output buffers. Each call copies the log-mel input into the
+        static buffer and replays the graph, replacing dozens of kernel launches
+        with a single one.
+        """
+
+        def __init__(self, encoder: torch.nn.Module):
+            super().__init__()
+            self.encoder = encoder
+            # (input shape, dtype) -> (graph, static input, static output)
+            self._graphs: Dict[tuple, tuple] = {}
+
+        def _capture(self, mel: torch.Tensor) -> tuple:
+            """Warm up on a side stream, then capture the encoder for this shape"""
+            static_in = mel.clone()
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.no_grad(), torch.cuda.stream(stream):
+                for _ in range(NUM_WARMUP):
+                    self.encoder(static_in)
+            torch.cuda.current_stream().wait_stream(stream)
+
+            graph = torch.cuda.CUDAGraph()
+            with torch.no_grad(), torch.cuda.graph(graph):
+                static_out = self.encoder(static_in)
+            return graph, static_in, static_out
+
+        def forward(self, mel: torch.Tensor) -> torch.Tensor:
+            key = (tuple(mel.shape), mel.dtype)
+            if key not in self._graphs:
+                self._graphs[key] = self._capture(mel)
+            graph, static_in, static_out = self._graphs[key]
+            static_in.copy_(mel)
+            graph.replay()
+            # The static buffer is overwritten by the next replay
+            return static_out.clone()
+
+    return _CUDAGraphEncoder
+
+
+def _replace_linear(module: "torch.nn.Module", factory):
+    """Recursively replace every nn.Linear below module with factory(linear)"""
+    import torch
+
+    for name, child in module.named_children():
+        if isinstance(child, torch.nn.Linear):
+            setattr(module, name, factory(child))
+        else:
+            _replace_linear(child, factory)
+
+
+def _quantize_int8(stt, device: str):
+    """
+    Quantize the model's linear layers to int8 weights in place
+    
+    On CUDA the layers become bitsandbytes Linear8bitLt modules, which quantize
+    their weights when moved to the GPU. On CPU they are converted with PyTorch
+    dynamic quantization (int8 weights, activations quantized on the fly).
+    """
+    import torch
+
+    if device == "cuda":
+        import bitsandbytes as bnb
+
+        def to_int8(linear: torch.nn.Linear) -> torch.nn.Module:
+            quantized = bnb.nn.Linear8bitLt(
+                linear.in_features,
+                linear.out_features,
+                bias=linear.bias is not None,
+                has_fp16_weights=False,
+            )
+            quantized.weight = bnb.nn.Int8Params(
+                linear.weight.data.cpu(), requires_grad=False, has_fp16_weights=False
+            )
+            if linear.bias is not None:
+                quantized.bias = torch.nn.Parameter(
+                    linear.bias.data, requires_grad=False
+                )
+            return quantized.to(device)
+
+        _replace_linear(stt, to_int8)
+    elif device == "cpu":
+        # Whisper subclasses nn.Linear; dynamic quantization only converts the
+        # exact nn.Linear type, so swap in plain layers sharing the same weights
+        def to_plain(linear: torch.nn.Linear) -> torch.nn.Linear:
+            plain = torch.nn.Linear(
+                linear.in_features, linear.out_features, bias=linear.bias is not None
+            )
+            plain.weight = linear.weight
+            plain.bias = linear.bias
+            return plain
+
+        _replace_linear(stt, to_plain)
+        torch.ao.quantization.quantize_dynamic(
+            stt, {torch.nn.Linear}, dtype=torch.qint8, inplace=True
+        )
+    else:
+        logger.warning(
+            f"int8 quantization is not supported on {device}; using full precision"
+        )
+
+
+# Model loaders are cached so transcribers with the same settings share one
+# copy of the weights instead of reloading them from disk
+
+@functools.lru_cache(maxsize=4)
+def _load_whisper_model(
+    model: str,
+    device: str,
+    compile: bool,
+    cuda_graphs: bool,
+    quantize: Optional[str],
+):
+    """Load an openai-whisper PyTorch model"""
+    import whisper
+
+    # Weights stay fp32: whisper casts them to the fp16 activations as needed,
+    # and its LayerNorm runs in fp32
+    stt = whisper.load_model(model, device=device)
+    if quantize == "int8":
+        _quantize_int8(stt, device)
+    if compile:
+        # reduce-overhead compilation already records CUDA graphs
+        _compile_model(stt, device)
+    elif cuda_graphs and device == "cuda":
+        stt.encoder = _cuda_graph_encoder_class()(stt.encoder)
+    return stt
+
+
+@functools.lru_cache(maxsize=4)
+def _load_faster_whisper_model(
+    model: str,
+    device: str,
+    compute_type: str,
+    num_workers: int,
+    cpu_threads: int,
+):
+    """Load a faster-whisper (CTranslate2) model"""
+    from faster_whisper import WhisperModel
+
+    return WhisperModel(
+        model,
+        device=device,
+        compute_type=compute_type,
+        num_workers=num_workers,
+        cpu_threads=cpu_threads,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_ort_model(model_id: str, device: str):
+    """
+    Load a Hugging Face Whisper checkpoint into ONNX Runtime, with its processor
+    
+    The checkpoint is exported to ONNX once and saved under ONNX_CACHE_DIR;
+    later runs load the saved export instead of re-exporting the model.
+    """
+    from optimum.onnxruntime import ORTModelForSpeechSeq2Seq
+    from transformers import WhisperProcessor
+
+    export_dir = ONNX_CACHE_DIR / model_id.replace("/", "--")
+    if not export_dir.exists():
+        logger.info(f"Exporting {model_id} to ONNX in {export_dir} (first run only)")
+        export_dir.parent.mkdir(parents=True, exist_ok=True)
+        # Export into a scratch directory and rename it into place, so an
+        # interrupted or concurrent export never leaves a partial model behind
+        tmp_dir = Path(tempfile.mkdtemp(dir=export_dir.parent))
+        try:
+            exported = ORTModelForSpeechSeq2Seq.from_pretrained(model_id, export=True)
+            exported.save_pretrained(tmp_dir)
+            WhisperProcessor.from_pretrained(model_id).save_pretrained(tmp_dir)
+            os.rename(tmp_dir, export_dir)
+        except OSError:
+            if not export_dir.exists():
+                raise
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    on_cuda = device == "cuda"
+    processor = WhisperProcessor.from_pretrained(export_dir)
+    model = ORTModelForSpeechSeq2Seq.from_pretrained(
+        export_dir,
+        export=False,
+        provider="CUDAExecutionProvider" if on_cuda else "CPUExecutionProvider",
+        use_io_binding=on_cuda,
+    )
+    return processor, model
+
+
+# Locks serialising inference on shared PyTorch / ONNX Runtime models
+_INFERENCE_LOCKS: "weakref.WeakKeyDictionary[Any, threading.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+_INFERENCE_LOCKS_GUARD = threading.Lock()
+
+
+def _inference_lock(model) -> threading.Lock:
+    """Return the lock shared by every transcriber using this model instance"""
+    with _INFERENCE_LOCKS_GUARD:
+        lock = _INFERENCE_LOCKS.get(model)
+        if lock is None:
+            lock = _INFERENCE_LOCKS[model] = threading.Lock()
+        return lock
+
+class AudioRing:
+    """
+    Fixed-size int16 ring buffer written by an audio callback
+    
+    Positions are absolute sample counts since recording started, so a reader
+    can tell when the samples it asks for have already been overwritten.
+    """
+
+    def __init__(self, capacity: int):
+        """
+        Initialize the ring buffer
+        
+        Args:
+            capacity: Number of samples held before the oldest are overwritten
+        """
+        self.buffer = np.empty(capacity, dtype=np.int16)
+        self.written = 0
+
+    def write(self, block: np.ndarray) -> int:
+        """
+        Copy samples into the ring
+        
+        Args:
+            block: Samples to write (at most the ring's capacity)
+            
+        Returns:
+            Absolute position of the first sample written
+        """
+        size = len(self.buffer)
+        start = self.written
+        wpos = start % size
+        head = min(len(block), size - wpos)
+        self.buffer[wpos:wpos + head] = block[:head]
+        self.buffer[:len(block) - head] = block[head:]
+        self.written = start + len(block)
+        return start
+
+    def read(self, start: int, length: int) -> np.ndarray:
+        """
+        Read samples back from the ring
+        
+        Args:
+            start: Absolute position returned by write()
+            length: Number of samples
+            
+        Returns:
+            Copy of the int16 samples, unwrapped if they span the end of the buffer
+            
+        Raises:
+            RuntimeError: If the samples were overwritten before being read
+        """
+        size = len(self.buffer)
+        self._check_overrun(start)
+        rpos = start % size
+        end = rpos + length
+        if end <= size:
+            samples = self.buffer[rpos:end].copy()
+        else:
+            samples = np.concatenate((self.buffer[rpos:], self.buffer[:end - size]))
+        # The writer may have lapped the reader while copying
+        self._check_overrun(start)
+        return samples
+
+    def _check_overrun(self, start: int):
+        """Raise if samples from start onwards have been overwritten"""
+        if self.written - start > len(self.buffer):
+            raise RuntimeError(
+                f"Audio ring buffer overrun: reader fell more than "
+                f"{len(self.buffer)} samples behind"
+            )
+
+
 class WhisperTranscriber:
     # Available Whisper models
     AVAILABLE_MODELS = [
@@ -28,13 +398,32 @@ class WhisperTranscriber:
         "large", "large-v3-turbo", "turbo"
     ]
 
+    # Available inference backends
+    AVAILABLE_BACKENDS = ["whisper", "faster-whisper", "ort"]
+
+    # Batched windows treated as silence, as in whisper's transcribe() defaults
+    NO_SPEECH_THRESHOLD = 0.6
+    LOGPROB_THRESHOLD = -1.0
+
+    # Hugging Face checkpoints for whisper model aliases (ONNX Runtime backend)
+    HF_MODEL_ALIASES = {
+        "large-v1": "large",
+        "large": "large-v3",
+        "turbo": "large-v3-turbo",
+    }
+
     def __init__(
         self,
         model: str = "base.en",
         language: str = "en",
         temperature: float = 0.0,
         initial_prompt: str = "This is a diary entry.",
-        device: str = "cpu",
+        device: Optional[str] = None,
+        compile: bool = False,
+        backend: str = "faster-whisper",
+        cuda_graphs: bool = False,
+        quantize: Optional[str] = None,
+        workers: int = 1,
     ):
         """
         Initialize Whisper transcriber
@@ -44,23 +433,141 @@ class WhisperTranscriber:
             language: Language code for transcription
             temperature: Sampling temperature (0.0 to 1.0)
             initial_prompt: Initial prompt for transcription
-            device: Device to run model on ('cpu' or 'cuda')
+            device: Device to run model on ('cpu', 'cuda' or 'mps'); CUDA or CPU
+                if None
+            compile: Compile the model with torch.compile (whisper backend, GPU only)
+            backend: Inference backend ('faster-whisper', 'whisper' or 'ort')
+            cuda_graphs: Replay the encoder from captured CUDA graphs (whisper
+                backend, CUDA only)
+            quantize: 'int8' to quantize linear layers (whisper backend; faster-whisper
+                always runs int8)
+            workers: Number of transcriptions that may run concurrently
+                (faster-whisper); the other backends serialise calls on the shared
+                model
         """
         self.model = self._validate_model(model)
         self.language = language
         self.temperature = temperature
         self.initial_prompt = initial_prompt
-        self.device = device
+        self.backend = self._validate_backend(backend)
+        self.device = device or _detect_device(self.backend)
+        self.fp16 = self.device != "cpu"
+        self.compile = compile and self.device != "cpu" and self.backend == "whisper"
+        self.cuda_graphs = (
+            cuda_graphs and self.device == "cuda" and self.backend == "whisper"
+        )
+        self.quantize = self._validate_quantize(quantize)
+        self.workers = max(1, workers)
         
         # Load Whisper model
-        logger.info(f"Loading Whisper model: {self.model}")
+        logger.info(
+            f"Loading Whisper model: {self.model} on {self.device} ({self.backend})"
+        )
         try:
-            self.stt = whisper.load_model(self.model, device=device)
+            if self.backend == "faster-whisper":
+                from faster_whisper import BatchedInferencePipeline
+
+                self.stt = self._load_faster_whisper()
+                self.batched = BatchedInferencePipeline(model=self.stt)
+            elif self.backend == "ort":
+                self.stt = self._load_ort()
+            else:
+                self.stt = _load_whisper_model(
+                    self.model,
+                    self.device,
+                    self.compile,
+                    self.cuda_graphs,
+                    self.quantize,
+                )
+            # CTranslate2 runs concurrent calls on its own worker pool; openai-whisper
+            # installs KV-cache hooks on the model per decode, and ONNX Runtime
+            # shares one I/O binding, so those calls take turns
+            if self.backend == "faster-whisper":
+                self._lock = contextlib.nullcontext()
+            else:
+                self._lock = _inference_lock(self.stt)
+            # Tokenise the fixed prompt once; per-call additions are encoded separately
+            self._tokenizer = self._get_tokenizer()
+            self._initial_prompt_ids = self._encode_prompt(self.initial_prompt)
             logger.info(f"Successfully loaded model: {self.model}")
         except Exception as e:
             logger.error(f"Failed to load model {self.model}: {str(e)}")
             raise RuntimeError(f"Failed to load Whisper model: {str(e)}")
 
+    def _load_faster_whisper(self):
+        """
+        Load the model with the CTranslate2 backend using int8 weights
+        
+        CTranslate2 has no MPS support, so anything other than CUDA runs on CPU.
+        One model replica is created per worker, and on CPU the cores are split
+        between them so concurrent transcriptions don't oversubscribe.
+        """
+        device = "cuda" if self.device == "cuda" else "cpu"
+        compute_type = "int8_float16" if device == "cuda" else "int8"
+        cpu_threads = (
+            max(1, (os.cpu_count() or 1) // self.workers) if device == "cpu" else 0
+        )
+        return _load_faster_whisper_model(
+            self.model, device, compute_type, self.workers, cpu_threads
+        )
+
+    def _load_ort(self):
+        """
+        Load an ONNX export of the model into ONNX Runtime
+        
+        On CUDA the session uses I/O binding, so encoder outputs and the
+        decoder KV cache stay on the GPU between decoding steps instead of
+        round-tripping through host memory.
+        """
+        model_id = f"openai/whisper-{self.HF_MODEL_ALIASES.get(self.model, self.model)}"
+        self.processor, stt = _load_ort_model(model_id, self.device)
+        return stt
+
+    def _get_tokenizer(self):
+        """Get the backend's Whisper tokenizer (ONNX Runtime uses its processor)"""
+        if self.backend == "faster-whisper":
+            from faster_whisper.tokenizer import Tokenizer
+
+            return Tokenizer(
+                self.stt.hf_tokenizer,
+                self.stt.model.is_multilingual,
+                task="transcribe",
+                language=self.language,
+            )
+        if self.backend == "whisper":
+            import whisper
+
+            return whisper.tokenizer.get_tokenizer(
+                self.stt.is_multilingual,
+                num_languages=self.stt.num_languages,
+                language=self.language,
+                task="transcribe",
+            )
+        return None
+
+    def _encode_prompt(self, text: str):
+        """Encode prompt text the way Whisper does, as a space-prefixed continuation"""
+        if self.backend == "ort":
+            return self.processor.get_prompt_ids(text, return_tensors="pt")
+        return self._tokenizer.encode(" " + text.strip())
+
+    def _prompt_ids(self, additional_prompt: Optional[str] = None):
+        """
+        Get the prompt token ids, extending the pre-tokenised initial prompt
+        
+        Args:
+            additional_prompt: Additional context appended to the initial prompt
+            
+        Returns:
+            Token ids (a tensor for the ONNX Runtime backend)
+        """
+        if not additional_prompt:
+            return self._initial_prompt_ids
+        if self.backend == "ort":
+            # The processor prefixes the prompt with a special token, so re-encode
+            return self._encode_prompt(f"{self.initial_prompt} {additional_prompt}")
+        return self._initial_prompt_ids + self._encode_prompt(additional_prompt)
+
     def _validate_model(self, model: str) -> str:
         """
         Validate and normalize model name
@@ -86,19 +593,127 @@ class WhisperTranscriber:
         
         return model
 
-    def _get_audio_duration(self, audio_path: Path) -> float:
-        """Get duration of audio file in seconds"""
+    def _validate_backend(self, backend: str) -> str:
+        """
+        Validate and normalize backend name
+        
+        Args:
+            backend: Backend name to validate
+            
+        Returns:
+            Validated backend name
+            
+        Raises:
+            ValueError: If backend name is invalid
+        """
+        backend = backend.lower().strip()
+        
+        if backend not in self.AVAILABLE_BACKENDS:
+            raise ValueError(
+                f"Invalid backend: {backend}. "
+                f"Available backends are: {', '.join(self.AVAILABLE_BACKENDS)}"
+            )
+        
+        return backend
+
+    def _validate_quantize(self, quantize: Optional[str]) -> Optional[str]:
+        """
+        Validate the weight quantization mode
+        
+        Args:
+            quantize: Quantization mode to validate, or None for full precision
+            
+        Returns:
+            Validated quantization mode
+            
+        Raises:
+            ValueError: If the quantization mode is invalid
+        """
+        if quantize is None:
+            return None
+        
+        quantize = quantize.lower().strip()
+        if quantize != "int8":
+            raise ValueError(
+                f"Invalid quantization mode: {quantize}. Only 'int8' is supported"
+            )
+        
+        return quantize
+
+    def _load_audio(self, audio_path: Path) -> Tuple[np.ndarray, float]:
+        """
+        Load audio file into a float32 numpy array
+        
+        Args:
+            audio_path: Path to audio file
+            
+        Returns:
+            Tuple of mono audio samples and duration in seconds
+            
+        Raises:
+            ValueError: If the file is not sampled at 16 kHz
+        """
+        if sf is not None:
+            audio_np, rate = self._read_soundfile(audio_path)
+        else:
+            audio_np, rate = self._read_wav(audio_path)
+        if rate != SAMPLE_RATE:
+            raise ValueError(f"Expected {SAMPLE_RATE} Hz audio, got {rate} Hz")
+        duration = len(audio_np) / float(rate)
+        if audio_np.ndim > 1:
+            audio_np = audio_np.mean(axis=1, dtype=np.float32)
+        return audio_np, duration
+
+    def _read_soundfile(self, audio_path: Path) -> Tuple[np.ndarray, int]:
+        """
+        Decode an audio file with libsndfile into a preallocated mono buffer
+        
+        Multi-channel audio is streamed in blocks and downmixed as it is read,
+        so the full interleaved frames are never held in memory.
+        """
+        with sf.SoundFile(str(audio_path)) as f:
+            rate = f.samplerate
+            audio_np = np.empty(f.frames, dtype=np.float32)
+            if f.channels == 1:
+                n = f.read(out=audio_np[:, None]).shape[0]
+            else:
+                n = 0
+                for block in f.blocks(blocksize=65536, dtype="float32", always_2d=True):
+                    block.mean(axis=1, out=audio_np[n:n + len(block)])
+                    n += len(block)
+        return audio_np[:n], rate
+
+    def _read_wav(self, audio_path: Path) -> Tuple[np.ndarray, int]:
+        """Read a 16-bit PCM WAV file into float32 samples with the stdlib reader"""
         with wave.open(str(audio_path), "rb") as wf:
-            frames = wf.getnframes()
+            channels = wf.getnchannels()
             rate = wf.getframerate()
-            return frames / float(rate)
+            raw = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+        # Scale and cast in one pass into a single output buffer
+        audio_np = np.empty(raw.shape, dtype=np.float32)
+        np.multiply(raw, np.float32(1.0 / 32768.0), out=audio_np, casting="unsafe")
+        if channels > 1:
+            audio_np = audio_np.reshape(-1, channels)
+        return audio_np, rate
 
-    def _load_audio(self, audio_path: Path) -> np.ndarray:
-        """Load audio file into numpy array"""
-        with wave.open(str(audio_path), "rb") as wf:
-            audio_data = wf.readframes(wf.getnframes())
-            audio_np = np.frombuffer(audio_data, dtype=np.int16).astype(np.float32) / 32768.0
-            return audio_np
+    def _load_audio_tensor(self, audio_path: Path) -> Tuple["torch.Tensor", float]:
+        """
+        Load audio file into a float32 tensor on the model device
+        
+        Whisper computes log-mel features on whichever device the audio lives
+        on, so this moves the STFT and mel projection onto the GPU when there
+        is one.
+        
+        Args:
+            audio_path: Path to audio file
+            
+        Returns:
+            Tuple of mono audio samples and duration in seconds
+        """
+        import torch
+
+        audio_np, duration = self._load_audio(audio_path)
+        return torch.from_numpy(audio_np).to(self.device), duration
 
     def transcribe(
         self,
@@ -124,21 +739,38 @@ class WhisperTranscriber:
             prompt = f"{prompt} {additional_prompt}"
 
         try:
-            # Load and process audio
-            logger.info(f"Loading audio file: {audio_path}")
-            audio_np = self._load_audio(audio_path)
-            duration = self._get_audio_duration(audio_path)
-            logger.info(f"Audio duration: {duration:.2f} seconds")
-
-            # Transcribe audio
             logger.info("Starting transcription...")
-            result = self.stt.transcribe(
-                audio_np,
-                fp16=False,  # Set to True if using GPU
-                language=self.language,
-                temperature=self.temperature,
-                initial_prompt=prompt
-            )
+            if self.backend == "faster-whisper":
+                # faster-whisper decodes and resamples the file itself
+                result = self._transcribe_faster_whisper(
+                    str(audio_path), self._prompt_ids(additional_prompt)
+                )
+                duration = result["duration"]
+                logger.info(f"Audio duration: {duration:.2f} seconds")
+            elif self.backend == "ort":
+                # Load and process audio
+                logger.info(f"Loading audio file: {audio_path}")
+                audio_np, duration = self._load_audio(audio_path)
+                logger.info(f"Audio duration: {duration:.2f} seconds")
+
+                result = self._transcribe_ort(
+                    audio_np, self._prompt_ids(additional_prompt)
+                )
+            else:
+                # Load and process audio
+                logger.info(f"Loading audio file: {audio_path}")
+                audio, duration = self._load_audio_tensor(audio_path)
+                logger.info(f"Audio duration: {duration:.2f} seconds")
+
+                # whisper.transcribe() only takes the prompt as text
+                with self._lock:
+                    result = self.stt.transcribe(
+                        audio,
+                        fp16=self.fp16,
+                        language=self.language,
+                        temperature=self.temperature,
+                        initial_prompt=prompt
+                    )
             logger.info("Transcription completed successfully")
 
             return {
@@ -156,21 +788,224 @@ class WhisperTranscriber:
             logger.error(f"Transcription failed: {str(e)}")
             raise RuntimeError(f"Failed to transcribe audio: {str(e)}")
 
-    def record_audio(self, stop_event: threading.Event, data_queue: Queue) -> None:
+    def _transcribe_ort(self, audio_np: np.ndarray, prompt_ids) -> Dict[str, Any]:
+        """
+        Run the ONNX Runtime model and return a result shaped like whisper's
+        
+        The audio is cut into 30-second windows that are decoded as one batch.
+        """
+        chunks = [
+            audio_np[start:start + N_SAMPLES]
+            for start in range(0, max(len(audio_np), 1), N_SAMPLES)
+        ]
+        features = self.processor(
+            chunks,
+            sampling_rate=SAMPLE_RATE,
+            return_tensors="pt",
+        ).input_features.to(self.stt.device)
+
+        generate_kwargs = {"prompt_ids": prompt_ids}
+        if not self.model.endswith(".en"):
+            generate_kwargs.update(language=self.language, task="transcribe")
+        if self.temperature > 0:
+            generate_kwargs.update(do_sample=True, temperature=self.temperature)
+
+        with self._lock:
+            token_ids = self.stt.generate(features, **generate_kwargs)
+        texts = self.processor.batch_decode(token_ids, skip_special_tokens=True)
+        return {"text": " ".join(t.strip() for t in texts if t.strip())}
+
+    def _transcribe_faster_whisper(
+        self,
+        audio,
+        prompt: Union[str, List[int]],
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
-        Record audio from microphone
+        Run faster-whisper and return a result shaped like whisper's, plus duration
+        
+        With a batch_size, the batched pipeline splits the audio into
+        VAD-bounded chunks of up to 30 seconds and decodes them together. The
+        prompt may be token ids, except for the batched pipeline, which
+        tokenises it itself and needs text.
+        """
+        kwargs = {"batch_size": batch_size} if batch_size else {}
+        segments, info = (self.batched if batch_size else self.stt).transcribe(
+            audio,
+            language=self.language,
+            temperature=self.temperature,
+            initial_prompt=prompt,
+            beam_size=1,
+            vad_filter=True,  # Skip silence instead of decoding it
+            **kwargs,
+        )
+        segments = [
+            {"id": seg.id, "start": seg.start, "end": seg.end, "text": seg.text}
+            for seg in segments
+        ]
+        return {
+            "text": "".join(seg["text"] for seg in segments),
+            "segments": segments,
+            "duration": info.duration,
+        }
+
+    def transcribe_batch(
+        self,
+        audio_paths: List[Path],
+        batch_size: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe several audio files with batched decoding
+        
+        With the whisper backend, every file is split into 30-second windows,
+        and windows from all files are stacked into (batch, n_mels, 3000)
+        log-mel tensors that go through the model in a single forward pass per
+        batch. With faster-whisper, each file runs through the batched
+        inference pipeline, which decodes its speech chunks in batches.
+        
+        Args:
+            audio_paths: Paths to audio files
+            batch_size: Maximum number of windows decoded together
+            
+        Returns:
+            List of transcription dictionaries, in the order of audio_paths
+        """
+        for audio_path in audio_paths:
+            if not audio_path.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        if self.backend == "faster-whisper":
+            return self._transcribe_batch_faster_whisper(audio_paths, batch_size)
+        if self.backend == "ort":
+            # Each file's windows are already decoded as one batch
+            return [self.transcribe(audio_path) for audio_path in audio_paths]
+
+        import torch
+        import whisper
+
+        try:
+            # Compute each file's log-mel features in one pass on the model
+            # device, then split them into fixed-size 30-second windows
+            windows = []
+            durations = []
+            for index, audio_path in enumerate(audio_paths):
+                logger.info(f"Loading audio file: {audio_path}")
+                audio, duration = self._load_audio_tensor(audio_path)
+                durations.append(duration)
+                n_windows = max(1, -(-len(audio) // N_SAMPLES))
+                audio = torch.nn.functional.pad(
+                    audio, (0, n_windows * N_SAMPLES - len(audio))
+                )
+                mel = whisper.log_mel_spectrogram(audio, self.stt.dims.n_mels)
+                for window in mel.split(whisper.audio.N_FRAMES, dim=-1):
+                    windows.append((index, window))
+
+            options = whisper.DecodingOptions(
+                language=self.language,
+                temperature=self.temperature,
+                prompt=self._initial_prompt_ids,
+                fp16=self.fp16,
+            )
+
+            # Decode windows in batches
+            logger.info(
+                f"Starting batched transcription of {len(audio_paths)} files "
+                f"({len(windows)} windows)..."
+            )
+            texts: List[List[str]] = [[] for _ in audio_paths]
+            for start in range(0, len(windows), batch_size):
+                batch = windows[start:start + batch_size]
+                mel = torch.stack([mel for _, mel in batch])
+                with self._lock:
+                    results = whisper.decode(self.stt, mel, options)
+                for (index, _), result in zip(batch, results):
+                    # Padded tail windows are mostly silence, which whisper
+                    # tends to fill with hallucinated text
+                    if (
+                        result.no_speech_prob > self.NO_SPEECH_THRESHOLD
+                        and result.avg_logprob < self.LOGPROB_THRESHOLD
+                    ):
+                        continue
+                    texts[index].append(result.text.strip())
+            logger.info("Batched transcription completed successfully")
+
+            return [
+                {
+                    "text": " ".join(t for t in file_texts if t),
+                    "duration": duration,
+                    "language": self.language,
+                    "model": self.model,
+                    "metadata": {
+                        "temperature": self.temperature,
+                        "prompt": self.initial_prompt,
+                        "segments": [],
+                    }
+                }
+                for file_texts, duration in zip(texts, durations)
+            ]
+        except Exception as e:
+            logger.error(f"Batched transcription failed: {str(e)}")
+            raise RuntimeError(f"Failed to transcribe audio: {str(e)}") from e
+
+    def _transcribe_batch_faster_whisper(
+        self,
+        audio_paths: List[Path],
+        batch_size: int,
+    ) -> List[Dict[str, Any]]:
+        """Transcribe files one by one through faster-whisper's batched pipeline"""
+        transcriptions = []
+        try:
+            for audio_path in audio_paths:
+                logger.info(f"Starting batched transcription of {audio_path}...")
+                result = self._transcribe_faster_whisper(
+                    str(audio_path), self.initial_prompt, batch_size=batch_size
+                )
+                transcriptions.append({
+                    "text": result["text"].strip(),
+                    "duration": result["duration"],
+                    "language": self.language,
+                    "model": self.model,
+                    "metadata": {
+                        "temperature": self.temperature,
+                        "prompt": self.initial_prompt,
+                        "segments": result["segments"],
+                    }
+                })
+            logger.info("Batched transcription completed successfully")
+        except Exception as e:
+            logger.error(f"Batched transcription failed: {str(e)}")
+            raise RuntimeError(f"Failed to transcribe audio: {str(e)}") from e
+        
+        return transcriptions
+
+    def record_audio(
+        self,
+        stop_event: threading.Event,
+        data_queue: Queue,
+        max_seconds: int = 30,
+    ) -> None:
+        """
+        Record audio from microphone into a ring buffer
+        
+        Each call records into its own AudioRing. The audio callback copies each
+        block into it and queues (ring, start, length) rather than a new bytes
+        object; consumers fetch the samples with ring.read(start, length).
         
         Args:
             stop_event: Threading event to signal stop recording
-            data_queue: Queue to store recorded audio data
+            data_queue: Queue receiving (ring, start, length) for each block
+            max_seconds: Capacity of the ring buffer in seconds
         """
+        ring = AudioRing(max_seconds * SAMPLE_RATE)
+
         def callback(indata, frames, time, status):
             if status:
                 logger.warning(f"Audio recording status: {status}")
-            data_queue.put(bytes(indata))
+            block = np.frombuffer(indata, dtype=np.int16)
+            data_queue.put((ring, ring.write(block), len(block)))
 
         with sd.RawInputStream(
-            samplerate=16000,
+            samplerate=SAMPLE_RATE,
             dtype="int16",
             channels=1,
             callback=callback
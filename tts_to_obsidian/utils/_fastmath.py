@@ -0,0 +1,22 @@
+"""
+Numba-compiled numeric kernels shared across the application
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def pcm_f32_to_i16(src: np.ndarray, dst: np.ndarray):
+    """Scale, clip and cast float32 samples to int16 PCM in a single pass"""
+    for i in prange(src.shape[0]):
+        v = src[i] * 32767.0
+        if v < -32768.0:
+            v = -32768.0
+        elif v > 32767.0:
+            v = 32767.0
+        dst[i] = np.int16(v)
+
+
+# Compile the kernels at import so the first caller isn't hit by JIT latency
+pcm_f32_to_i16(np.zeros(2, dtype=np.float32), np.empty(2, dtype=np.int16))
\ No newline at end of file
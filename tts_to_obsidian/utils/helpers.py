@@ -3,16 +3,33 @@ Utility functions for the Voice-to-Diary application
 """
 
 import os
+import copy
+import fnmatch
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import yaml
 from datetime import datetime
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+# Prefer the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Parsed configurations keyed by path, as (modification time, config)
+_CFG_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
 def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     """
     Load configuration from YAML file
     
+    The parsed configuration is cached by path and modification time, so repeated
+    calls only re-read the file after it has changed. Each caller gets its own
+    copy, so changes to it don't leak into other callers.
+    
     Args:
         config_path: Path to config file (default: config.yaml in current directory)
         
@@ -22,11 +39,20 @@ def load_config(config_path: Optional[Path] = None) -> Dict[str, Any]:
     if config_path is None:
         config_path = Path("config.yaml")
     
-    if not config_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    try:
+        mtime = config_path.stat().st_mtime
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Configuration file not found: {config_path}"
+        ) from None
+    
+    key = str(config_path)
+    cached = _CFG_CACHE.get(key)
+    if cached is None or cached[0] != mtime:
+        with open(config_path, "rb") as f:
+            cached = _CFG_CACHE[key] = (mtime, yaml.load(f, Loader=_YamlLoader))
     
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    return copy.deepcopy(cached[1])
 
 def ensure_directory(path: Path):
     """Ensure directory exists, create if it doesn't"""
@@ -34,7 +60,9 @@ def ensure_directory(path: Path):
 
 def get_timestamp() -> str:
     """Get current timestamp in ISO format"""
-    return datetime.now().isoformat()
+    now = time.time()
+    seconds = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(now))
+    return f"{seconds}.{int(now % 1 * 1e6):06d}"
 
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to human-readable string"""
@@ -59,9 +87,22 @@ def cleanup_old_files(directory: Path, pattern: str, days: int):
     """
     cutoff = datetime.now().timestamp() - (days * 24 * 60 * 60)
     
-    for file in directory.glob(pattern):
-        if file.stat().st_mtime < cutoff:
-            file.unlink()
+    # scandir entries carry their type from readdir, so only matches are stat'ed
+    with os.scandir(directory) as entries:
+        expired = [
+            entry.path
+            for entry in entries
+            if fnmatch.fnmatch(entry.name, pattern)
+            and entry.is_file(follow_symlinks=False)
+            and entry.stat(follow_symlinks=False).st_mtime < cutoff
+        ]
+    
+    # unlink releases the GIL, so a small pool overlaps the metadata round trips
+    if len(expired) > 1:
+        with ThreadPoolExecutor(max_workers=min(16, len(expired))) as executor:
+            list(executor.map(os.unlink, expired))
+    elif expired:
+        os.unlink(expired[0])
 
 def get_audio_duration(file_path: Path) -> float:
     """Get duration of audio file in seconds"""
@@ -72,10 +113,39 @@ def get_audio_duration(file_path: Path) -> float:
         rate = wf.getframerate()
         return frames / float(rate)
 
+def _copy_file_fast(src: Path, dst: Path):
+    """
+    Copy file contents in the kernel, then copy metadata
+    
+    Uses copy_file_range where available, which lets filesystems such as btrfs
+    and XFS share extents instead of copying bytes. Otherwise falls back to
+    shutil.copyfile, which uses sendfile/fcopyfile/CopyFileEx per platform.
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
 def copy_to_obsidian_media(file_path: Path, obsidian_vault: Path) -> Path:
     """
     Copy file to Obsidian media folder
     
+    Files already present with the same size and modification time are left
+    alone. On the same filesystem the file is hard-linked instead of copied.
+    
     Args:
         file_path: Path to file to copy
         obsidian_vault: Path to Obsidian vault
@@ -87,7 +157,22 @@ def copy_to_obsidian_media(file_path: Path, obsidian_vault: Path) -> Path:
     media_folder.mkdir(exist_ok=True)
     
     dest_path = media_folder / file_path.name
-    shutil.copy2(file_path, dest_path)
+    try:
+        src_stat, dest_stat = file_path.stat(), dest_path.stat()
+    except FileNotFoundError:
+        pass
+    else:
+        if (
+            src_stat.st_size == dest_stat.st_size
+            and int(src_stat.st_mtime) == int(dest_stat.st_mtime)
+        ):
+            return dest_path
+        dest_path.unlink()
+    
+    try:
+        os.link(file_path, dest_path)
+    except OSError:
+        _copy_file_fast(file_path, dest_path)
     
     return dest_path
 